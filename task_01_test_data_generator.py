@@ -1,18 +1,36 @@
 #!/usr/bin/env python3
+import os
 from pathlib import Path
 import random
 import shutil
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from faker import Faker
 
 fake = Faker()
 
+# Словник Faker беремо один раз — далі лише випадковий вибір з нього
+_WORDS = tuple(w.replace(" ", "_") for w in fake.get_words_list())
+
+# Номери 001..999 у вигляді готових рядків з нулями попереду
+_NUM_STRS = tuple(f"{i:03d}" for i in range(1000))
+
+_choice = random.choice
+_randint = random.randint
+
 EXTENSIONS = [
     "txt", "log", "jpg", "jpeg", "png",
     "gif", "pdf", "doc", "xml", "yml",
 ]
 
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif"})
+
+# Вміст файлів кодуємо заздалегідь — у файл пишемо готові байти
+_IMG_PAYLOAD = b"\x89PNG\r\nFAKE_IMAGE_DATA"
+_TEXT_PREFIX = "Generated test file: ".encode("utf-8")
+# Як і write_text, текстові файли закінчуємо платформним переносом рядка
+_TEXT_NEWLINE = os.linesep.encode("utf-8")
+
 # ---------------------------
 # Генератори читабельних імен
 # ---------------------------
@@ -24,10 +42,7 @@ def readable_filename() -> str:
       travel_photo_003
       user_notes_044
     """
-    w1 = fake.word().replace(" ", "_")
-    w2 = fake.word().replace(" ", "_")
-    num = random.randint(1, 999)
-    return f"{w1}_{w2}_{num:03d}"
+    return _choice(_WORDS) + "_" + _choice(_WORDS) + "_" + _NUM_STRS[_randint(1, 999)]
 
 
 def readable_dir_name() -> str:
@@ -37,9 +52,7 @@ def readable_dir_name() -> str:
       system_logs
       client_profiles
     """
-    w1 = fake.word().replace(" ", "_")
-    w2 = fake.word().replace(" ", "_")
-    return f"{w1}_{w2}"
+    return _choice(_WORDS) + "_" + _choice(_WORDS)
 
 
 # ---------------------------
@@ -119,9 +132,17 @@ def generate_random_tree(
 ) -> None:
     """Створює читабельну випадкову структуру каталогів і файлів
        з гарантованими мінімальними значеннями глибини/каталогів/файлів.
+
+    Спочатку вся структура будується в пам'яті як список записів
+    (parent, path, is_dir, payload) з рядковими шляхами, а потім одним проходом створюються
+    каталоги й записуються файли.
     """
 
-    def _gen(directory: Path, depth: int):
+    # Фаза 1: план дерева в пам'яті — жодних системних викликів
+    plan: List[Tuple[str, str, bool, bytes]] = []
+    sep = os.sep
+
+    def _gen(directory: str, depth: int):
         # Якщо глибина вже перевищила max_depth — зупиняємось
         if depth > max_depth:
             return
@@ -137,17 +158,14 @@ def generate_random_tree(
             num_dirs = random.randint(0, max_dirs_per_level)
 
         # ------------------------------------------
-        # Створюємо підкаталоги
+        # Плануємо підкаталоги
         # ------------------------------------------
         subdirs = []
         for _ in range(num_dirs):
             dname = readable_dir_name()
-            subdir = directory / dname
-            try:
-                subdir.mkdir(exist_ok=True)
-                subdirs.append(subdir)
-            except Exception as e:
-                print(f"[ERROR] Не вдалося створити каталог '{subdir}': {e}")
+            subdir = directory + sep + dname
+            plan.append((directory, subdir, True, b""))
+            subdirs.append(subdir)
 
         # Рекурсивно генеруємо структуру в кожному підкаталозі
         for sub in subdirs:
@@ -165,27 +183,50 @@ def generate_random_tree(
             num_files = random.randint(min_files_per_level, max_files_per_level)
 
         # ------------------------------------------
-        # Створюємо файли
+        # Плануємо файли
         # ------------------------------------------
         for _ in range(num_files):
-            ext = random.choice(EXTENSIONS)
+            ext = _choice(EXTENSIONS)
             fname = f"{readable_filename()}.{ext}"
-            fpath = directory / fname
 
-            try:
-                if ext in {"jpg", "jpeg", "png", "gif"}:
-                    fpath.write_bytes(b"\x89PNG\r\nFAKE_IMAGE_DATA")
-                else:
-                    fpath.write_text(
-                        f"Generated test file: {fname}\n",
-                        encoding="utf-8",
-                    )
-            except Exception as e:
-                print(f"[ERROR] Не вдалося записати файл '{fpath}': {e}")
-
-    # Старт рекурсії з кореня
-    _gen(root, 1)
+            if ext in IMAGE_EXTENSIONS:
+                payload = _IMG_PAYLOAD
+            else:
+                payload = _TEXT_PREFIX + fname.encode("utf-8") + _TEXT_NEWLINE
+            plan.append((directory, directory + sep + fname, False, payload))
+
+    # Старт рекурсії з кореня; Path існує лише на межі API
+    _gen(os.fspath(root), 1)
+
+    # Фаза 2: створюємо каталоги та файли одним проходом
+    # O_BINARY (лише Windows) — інакше CRT перетворить \n на \r\n
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    failed = set()  # каталоги, які не вдалося створити
+
+    for parent, path, is_dir, payload in plan:
+        # Вміст каталогу, який не вдалося створити, пропускаємо
+        if parent in failed:
+            if is_dir:
+                failed.add(path)
+            continue
 
+        if is_dir:
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            except OSError as e:
+                print(f"[ERROR] Не вдалося створити каталог '{path}': {e}")
+                failed.add(path)
+        else:
+            try:
+                fd = os.open(path, flags, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                print(f"[ERROR] Не вдалося записати файл '{path}': {e}")
 
 
 # ---------------------------
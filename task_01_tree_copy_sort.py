@@ -1,13 +1,19 @@
 import argparse
+import os
 import shutil
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple, Union
 
 from colorama import init, Fore, Style
 
-init(autoreset=True)
+# Кожен кольоровий рядок сам закінчується Style.RESET_ALL, тому autoreset
+# не потрібен: без нього colorama обгортає stdout лише тоді, коли треба
+# прибрати ANSI-коди (вивід не в термінал) або конвертувати їх (Windows)
+init()
 
 EXT_COLOR_MAP = {
     "txt":  Fore.GREEN,
@@ -25,13 +31,25 @@ EXT_COLOR_MAP = {
 DEFAULT_FILE_COLOR = Fore.WHITE
 BRANCH_COLOR = Fore.LIGHTBLACK_EX  # │ ├── └──
 
+# Незмінні фрагменти рядків дерева
+_DIR_NAME_START = Style.RESET_ALL + Style.BRIGHT
+_DEFAULT_FILE_NAME_START = Style.RESET_ALL + DEFAULT_FILE_COLOR
+_FILE_NAME_START = {ext: Style.RESET_ALL + color for ext, color in EXT_COLOR_MAP.items()}
+_LINE_END = Style.RESET_ALL + "\n"
+
+PROGRESS_REDRAW_INTERVAL = 0.05  # секунд між оновленнями прогрес-бару
+
 # Збираємо всі помилки тут
 ERRORS: List[str] = []
 
 
+_ERRORS_LOCK = threading.Lock()
+
+
 def warn(msg: str) -> None:
-    """Записуємо WARN (виведемо пізніше)."""
-    ERRORS.append(msg)
+    """Записуємо WARN (виведемо пізніше). Безпечно викликати з різних потоків."""
+    with _ERRORS_LOCK:
+        ERRORS.append(msg)
 
 
 def print_progress_bar(progress: float, width=40):
@@ -55,10 +73,16 @@ def parse_args():
     return parser.parse_args()
 
 
-def get_extension_subdir(path: Path) -> str:
+def file_extension(name: str) -> str:
+    """Повертає розширення імені файлу без крапки в нижньому регістрі (або '')."""
+    stem, _, ext = name.rpartition(".")
+    # Як і Path.suffix: '.bashrc' та 'name.' розширення не мають
+    return ext.lower() if stem else ""
+
+
+def get_extension_subdir(name: str) -> str:
     """Повертає підкаталог для розширення файлу."""
-    e = path.suffix.lower()
-    return e.lstrip(".") if e else "no_extension"
+    return file_extension(name) or "no_extension"
 
 
 def is_inside(child: Path, parent: Path) -> bool:
@@ -70,10 +94,15 @@ def is_inside(child: Path, parent: Path) -> bool:
         return False
 
 
-def collect_files_recursive(src: Path, out: List[Path], skip_dir: Optional[Path] = None):
-    """Рекурсивно збирає файли з каталогу src у список out, пропускаючи skip_dir."""
+def collect_files_recursive(src: str, out: List[str], skip_dir: Optional[str] = None):
+    """Рекурсивно збирає шляхи файлів з каталогу src у список out, пропускаючи skip_dir.
+
+    skip_dir порівнюється з шляхами записів як рядок, тому його треба
+    один раз нормалізувати (os.path.realpath) до виклику.
+    """
     try:
-        entries = list(src.iterdir())
+        with os.scandir(src) as it:
+            entries = list(it)
     except PermissionError:
         warn(f"Немає доступу: {src}")
         return
@@ -81,48 +110,75 @@ def collect_files_recursive(src: Path, out: List[Path], skip_dir: Optional[Path]
         warn(f"Помилка читання: {src}")
         return
 
-    for item in entries:
-        if skip_dir and item.resolve() == skip_dir.resolve():
+    for entry in entries:
+        if skip_dir is not None and entry.path == skip_dir:
             continue
 
         try:
-            if item.is_dir():
-                collect_files_recursive(item, out, skip_dir)
-            elif item.is_file():
-                out.append(item)
+            if entry.is_dir(follow_symlinks=False):
+                collect_files_recursive(entry.path, out, skip_dir)
+            elif entry.is_file():
+                out.append(entry.path)
         except PermissionError:
-            warn(f"Немає доступу: {item}")
+            warn(f"Немає доступу: {entry.path}")
         except OSError:
-            warn(f"Помилка читання: {item}")
+            warn(f"Помилка читання: {entry.path}")
+
 
+def copy_file(src_file: str, target_file: str) -> None:
+    """Копіює один файл, записуючи помилки через warn."""
+    try:
+        shutil.copyfile(src_file, target_file)
+    except PermissionError:
+        warn(f"Немає доступу: {src_file}")
+    except FileNotFoundError:
+        warn(f"Файл не знайдено: {src_file}")
+    except OSError:
+        warn(f"Помилка копіювання: {src_file}")
 
-def display_tree(path: Path, indent: str = "", prefix: str = ""):
-    """Виводить дерево файлів і каталогів, починаючи з path."""
-    if path.is_dir():
-        print(
-            BRANCH_COLOR + indent + prefix + Style.RESET_ALL +
-            Style.BRIGHT + path.name + Style.RESET_ALL
-        )
 
-        subindent = indent + ("    " if prefix else "")
-        try:
-            entries = sorted(path.iterdir(), key=lambda x: (x.is_file(), x.name))
-        except Exception:
-            warn(f"Немає доступу: {path}")
-            print(subindent + "└── [недоступно]")
-            return
+def copy_files(pairs: List[Tuple[str, str]]) -> None:
+    """Послідовно копіює пари (вихідний файл, цільовий файл)."""
+    for src_file, target_file in pairs:
+        copy_file(src_file, target_file)
 
-        for i, item in enumerate(entries):
-            is_last = i == len(entries) - 1
-            p = "└── " if is_last else "├── "
-            display_tree(item, subindent, p)
 
-    else:
-        color = EXT_COLOR_MAP.get(path.suffix.lstrip("."), DEFAULT_FILE_COLOR)
-        print(
-            BRANCH_COLOR + indent + prefix + Style.RESET_ALL +
-            color + path.name + Style.RESET_ALL
-        )
+def display_tree(root: Path):
+    """Виводить дерево файлів і каталогів, починаючи з root.
+
+    Обхід у глибину виконується з явним стеком, а всі рядки збираються
+    в буфер і виводяться одним записом у stdout.
+    """
+    buf: List[str] = []
+    stack: List[Tuple[Union[Path, os.DirEntry], str, str]] = [(root, "", "")]
+
+    while stack:
+        path, indent, prefix = stack.pop()
+        name = path.name
+
+        if path.is_dir():
+            buf.append(BRANCH_COLOR + indent + prefix + _DIR_NAME_START + name + _LINE_END)
+
+            subindent = indent + ("    " if prefix else "")
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: (e.is_file(), e.name))
+            except Exception:
+                warn(f"Немає доступу: {os.fspath(path)}")
+                buf.append(subindent + "└── [недоступно]\n")
+                continue
+
+            # У стек кладемо у зворотному порядку, щоб першим вийшов перший елемент
+            last = len(entries) - 1
+            for i in range(last, -1, -1):
+                p = "└── " if i == last else "├── "
+                stack.append((entries[i], subindent, p))
+
+        else:
+            name_start = _FILE_NAME_START.get(file_extension(name), _DEFAULT_FILE_NAME_START)
+            buf.append(BRANCH_COLOR + indent + prefix + name_start + name + _LINE_END)
+
+    sys.stdout.write("".join(buf))
 
 
 def main():
@@ -144,41 +200,53 @@ def main():
         return
 
     # Зібрати всі файли з SRC
-    files_to_copy: List[Path] = []
-    collect_files_recursive(src, files_to_copy, skip_dir)
+    # skip_dir нормалізуємо один раз — далі лише порівняння рядків
+    skip_str = os.path.realpath(skip_dir) if skip_dir else None
+    files_to_copy: List[str] = []
+    collect_files_recursive(str(src), files_to_copy, skip_str)
 
     total = len(files_to_copy)
     if total == 0:
         display_tree(dst)
         return
 
-    # Визначаємо затримку для анімації прогрес-бару
-    if total <= 20:
-        delay = 0.20
-    elif total <= 100:
-        delay = 0.10
-    else:
-        delay = 0.03
-
-    # Копіюємо файли з прогрес-баром
-    for i, file_path in enumerate(files_to_copy, start=1):
-
-        ext_dir = get_extension_subdir(file_path)
-        target_dir = dst / ext_dir
-        target_file = target_dir / file_path.name
-
+    # Підкаталоги для розширень створюємо один раз, до копіювання
+    file_exts = [get_extension_subdir(os.path.basename(f)) for f in files_to_copy]
+    ext_to_dir: Dict[str, str] = {}
+    for ext in sorted(set(file_exts)):
+        target_dir = dst / ext
         try:
-            target_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, target_file)
-        except PermissionError:
-            warn(f"Немає доступу: {file_path}")
-        except FileNotFoundError:
-            warn(f"Файл не знайдено: {file_path}")
+            target_dir.mkdir(exist_ok=True)
+            ext_to_dir[ext] = str(target_dir)
         except OSError:
-            warn(f"Помилка копіювання: {file_path}")
-
-        print_progress_bar(i / total)
-        time.sleep(delay)
+            warn(f"Не вдалося створити '{target_dir}'")
+
+    # Файли, що потрапляють в одне ім'я, збираємо в одну задачу і копіюємо
+    # по черзі — як і при послідовному копіюванні, перемагає останній файл,
+    # а в один файл ніколи не пишуть два потоки. Ключ без урахування регістру,
+    # бо на Windows і macOS 'Report.txt' та 'report.txt' — той самий файл
+    jobs: Dict[str, List[Tuple[str, str]]] = {}
+    for src_file, ext in zip(files_to_copy, file_exts):
+        target_dir = ext_to_dir.get(ext)
+
+        # Якщо підкаталог не створився — попередження вже записане
+        if target_dir is not None:
+            target_file = os.path.join(target_dir, os.path.basename(src_file))
+            jobs.setdefault(target_file.casefold(), []).append((src_file, target_file))
+
+    # Копіюємо файли паралельно з прогрес-баром
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(copy_files, pairs) for pairs in jobs.values()]
+
+        total = len(futures)
+        last_draw = 0.0
+        for i, _ in enumerate(as_completed(futures), start=1):
+            # Перемальовуємо прогрес-бар не частіше, ніж раз на PROGRESS_REDRAW_INTERVAL
+            now = time.monotonic()
+            if i == total or now - last_draw >= PROGRESS_REDRAW_INTERVAL:
+                print_progress_bar(i / total)
+                last_draw = now
 
     print()
 
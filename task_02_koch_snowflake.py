@@ -1,4 +1,10 @@
+import math
+import operator
 import turtle
+from functools import lru_cache
+from itertools import accumulate
+from typing import List
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -6,14 +12,46 @@ from rich.text import Text
 console = Console()
 
 
-def koch_curve(t, order, size):
-    """Малює криву Коха за допомогою черепашки t та рекурсії."""
+# Напрямок кожного відрізка кодуємо числом k (кут 60°·k), k = 0..5.
+# ROTATIONS[r] — таблиця для bytes.translate, що повертає напрямки на 60°·r
+ROTATIONS = tuple(bytes((k + r) % 6 for k in range(256)) for r in range(6))
+
+# Одиничні вектори для шести можливих напрямків (кратних 60°)
+HEADING_VECTORS = tuple(
+    (math.cos(math.radians(60 * k)), math.sin(math.radians(60 * k)))
+    for k in range(6)
+)
+
+
+@lru_cache(maxsize=None)
+def koch_headings(order: int) -> bytes:
+    """Рекурсивно будує напрямки відрізків кривої Коха заданого рівня.
+
+    Правило L-системи F → F+F--F+F означає, що крива рівня n складається
+    з чотирьох копій кривої рівня n-1, повернутих на 0°, +60°, -60° і 0°.
+    """
     if order == 0:
-        t.forward(size)
-    else:
-        for angle in [60, -120, 60, 0]:
-            koch_curve(t, order - 1, size / 3)
-            t.left(angle)
+        return bytes((0,))
+
+    prev = koch_headings(order - 1)
+    return prev + prev.translate(ROTATIONS[1]) + prev.translate(ROTATIONS[5]) + prev
+
+
+def koch_snowflake_points(order: int, size: float) -> List[float]:
+    """Обчислює координати вершин сніжинки Коха як плаский список x0, y0, x1, y1, ..."""
+    unit = size / 3 ** order
+    step_x = [unit * dx for dx, _ in HEADING_VECTORS]
+    step_y = [unit * dy for _, dy in HEADING_VECTORS]
+
+    # Три сторони — одна й та сама крива, щоразу повернута на 120° праворуч
+    side = koch_headings(order)
+    headings = side + side.translate(ROTATIONS[4]) + side.translate(ROTATIONS[2])
+
+    # Накопичувальні суми кроків рахуються в C, без циклу інтерпретатора
+    points = [0.0] * (2 * (len(headings) + 1))
+    points[0::2] = accumulate(map(step_x.__getitem__, headings), initial=-size / 2)
+    points[1::2] = accumulate(map(step_y.__getitem__, headings), initial=size / 3)
+    return points
 
 
 def draw_koch_snowflake(order: int, size: int = 300):
@@ -25,16 +63,14 @@ def draw_koch_snowflake(order: int, size: int = 300):
     window = turtle.Screen()
     window.bgcolor("white")
 
-    t = turtle.Turtle()
-    t.speed(0)
-    t.penup()
-    t.goto(-size / 2, size / 3)
-    t.pendown()
+    points = koch_snowflake_points(order, size)
+    # У канвасі Tk вісь y спрямована вниз
+    points[1::2] = map(operator.neg, points[1::2])
 
-    for _ in range(3):
-        koch_curve(t, order, size)
-        t.right(120)
+    # Вся ламана — один виклик Tk замість окремого кроку на кожен відрізок
+    window.getcanvas().create_line(*points, fill="black")
 
+    window.update()
     window.mainloop()
 
 